@@ -12,23 +12,11 @@ import pulumi
 from pulumi_kubernetes.apps.v1 import Deployment
 from pulumi_kubernetes.core.v1 import Namespace
 from pulumi_kubernetes.helm.v3 import Release
-from components.nginx import NginxComponent
-from components.cert_manager import CertManagerComponent
-from components.rancher import RancherComponent
-from components.ingress import IngressComponent
-
-# Initialize components
-nginx_component: NginxComponent = NginxComponent(name="nginx")
-cert_manager_component: CertManagerComponent = CertManagerComponent(name="cert-manager")
-ingress_component: IngressComponent = IngressComponent(name="ingress-nginx")
-rancher_component: RancherComponent = RancherComponent(name="rancher", namespace="cattle-system")
-
-# Deploy Nginx
-nginx_deployment: Deployment
-nginx_namespace: Namespace
-nginx_deployment, nginx_namespace = nginx_component.deploy(
-    replicas=1,
-    image="nginx:latest"
+from components.registry import (
+    nginx_component,
+    cert_manager_component,
+    ingress_component,
+    rancher_component,
 )
 
 # Deploy NGINX Ingress Controller
@@ -42,6 +30,21 @@ ingress_release, ingress_namespace = ingress_component.deploy(
     default_tls=True
 )
 
+# Deploy Nginx with Service and Ingress
+nginx_hostname: str = "nginx.local"
+nginx_deployment: Deployment
+nginx_namespace: Namespace
+nginx_deployment, nginx_namespace = nginx_component.deploy(
+    depends_on_release=ingress_release,
+    replicas=1,
+    image="nginx:latest",
+    service=True,
+    traffic_distribution="PreferClose",
+    ingress=True,
+    hostname=nginx_hostname,
+    ingress_class=ingress_component.ingress_class
+)
+
 # Deploy Cert-Manager
 cert_manager_release: Release
 cert_manager_namespace: Namespace
@@ -57,7 +60,7 @@ rancher_release, rancher_namespace = rancher_component.deploy(
     version="2.11.2",
     hostname="rancher.local",
     replicas=1,
-    ingress_class="nginx",
+    ingress_class=ingress_component.ingress_class,
     tls_source="rancher",
     bootstrap_password="admin123"
 )
@@ -68,6 +71,11 @@ nginx_output: Dict[str, Any] = {
     "namespace": nginx_namespace.metadata["name"],
     "deployment_namespace": nginx_deployment.metadata["namespace"]
 }
+if nginx_component.service is not None:
+    nginx_output["service_name"] = nginx_component.service.metadata["name"]
+if nginx_component.ingress is not None:
+    nginx_output["ingress_name"] = nginx_component.ingress.metadata["name"]
+    nginx_output["hostname"] = nginx_hostname
 
 ingress_output: Dict[str, Any] = {
     "release_name": ingress_release.name,
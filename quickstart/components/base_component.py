@@ -5,7 +5,7 @@
 
 """Base component class for Pulumi resources."""
 
-from typing import Any, Dict, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import pulumi
 import pulumi_kubernetes.core.v1 as core
 from pulumi_kubernetes.core.v1 import Namespace
@@ -69,6 +69,24 @@ class BaseComponent:
         """
         return self._resource
 
+    def import_targets(self, outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Describe the cluster resources owned by the component for adoption.
+
+        Args:
+            outputs: The component's section of the recorded stack outputs
+
+        Returns:
+            List of targets with Pulumi type, logical name, Kubernetes
+            namespace, recorded resource name, optional label selector and
+            whether the target may be absent from the cluster
+        """
+        return [{
+            "type": "kubernetes:core/v1:Namespace",
+            "name": self.namespace_name,
+            "namespace": None,
+            "resource_name": outputs.get("namespace", self.namespace_name),
+        }]
+
     def deploy(self, **kwargs: Dict[str, Any]) -> Tuple[PulumiResource, Namespace]:
         """Deploy the component. Must be implemented by subclasses.
 
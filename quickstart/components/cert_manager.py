@@ -6,9 +6,9 @@
 from typing import Dict, Optional, Tuple, Any
 import pulumi_kubernetes.helm.v3 as helm
 from pulumi_kubernetes.core.v1 import Namespace
-from .base_component import BaseComponent
+from .helm_component import HelmComponent
 
-class CertManagerComponent(BaseComponent):
+class CertManagerComponent(HelmComponent):
     """Cert Manager deployment component."""
 
     def __init__(self, name: str = "cert-manager", namespace: Optional[str] = None) -> None:
@@ -0,0 +1,29 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Base component class for Helm-backed resources."""
+
+from typing import Any, Dict, List
+from .base_component import BaseComponent
+
+class HelmComponent(BaseComponent):
+    """Base class for components deployed as a Helm release."""
+
+    def import_targets(self, outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Describe the namespace and Helm release for adoption.
+
+        Args:
+            outputs: The component's section of the recorded stack outputs
+
+        Returns:
+            List of import targets, the release matched by its Helm storage secrets
+        """
+        return super().import_targets(outputs) + [{
+            "type": "kubernetes:helm.sh/v3:Release",
+            "name": self.name,
+            "namespace": outputs.get("namespace", self.namespace_name),
+            "resource_name": outputs.get("release_name"),
+            "labels": {"owner": "helm", "status": "deployed"},
+        }]
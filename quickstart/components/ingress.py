@@ -7,19 +7,26 @@ from typing import Dict, Optional, Tuple, Any
 import pulumi
 import pulumi_kubernetes.helm.v3 as helm
 from pulumi_kubernetes.core.v1 import Namespace
-from .base_component import BaseComponent
+from .helm_component import HelmComponent
 
-class IngressComponent(BaseComponent):
+class IngressComponent(HelmComponent):
     """NGINX Ingress Controller deployment component."""
 
-    def __init__(self, name: str = "ingress-nginx", namespace: str = "ingress-nginx") -> None:
+    def __init__(
+        self,
+        name: str = "ingress-nginx",
+        namespace: str = "ingress-nginx",
+        ingress_class: str = "nginx"
+    ) -> None:
         """Initialize NGINX Ingress Controller component.
 
         Args:
             name: Name of the component (default: ingress-nginx)
             namespace: Namespace name (default: ingress-nginx)
+            ingress_class: IngressClass name served by the controller (default: nginx)
         """
         super().__init__(name, namespace)
+        self.ingress_class: str = ingress_class
 
     def deploy(self, **kwargs: Dict[str, Any]) -> Tuple[helm.Release, Namespace]:
         """Deploy NGINX Ingress Controller component.
@@ -46,6 +53,12 @@ class IngressComponent(BaseComponent):
         values: Dict[str, Any] = {
             "controller": {
                 "name": "controller",
+                # 显式声明 IngressClass，供其他组件的 Ingress 绑定
+                "ingressClass": self.ingress_class,
+                "ingressClassResource": {
+                    "name": self.ingress_class,
+                    "enabled": True,
+                },
                 "image": {
                     "allowPrivilegeEscalation": False,
                 },
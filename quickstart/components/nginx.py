@@ -3,9 +3,11 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
-from typing import Dict, Optional, Tuple, Any
+from typing import Dict, Optional, Tuple, Any, Union, List
+import pulumi
 from pulumi_kubernetes.apps.v1 import Deployment
-from pulumi_kubernetes.core.v1 import Namespace
+from pulumi_kubernetes.core.v1 import Namespace, Service
+from pulumi_kubernetes.networking.v1 import Ingress
 from .base_component import BaseComponent
 
 class NginxComponent(BaseComponent):
@@ -20,16 +22,79 @@ class NginxComponent(BaseComponent):
         """
         super().__init__(name, namespace)
         self.app_labels: Dict[str, str] = {"app": self.name}
+        self._service: Optional[Service] = None
+        self._ingress: Optional[Ingress] = None
 
-    def deploy(self, **kwargs: Dict[str, Any]) -> Tuple[Deployment, Namespace]:
+    @property
+    def service(self) -> Optional[Service]:
+        """Get the Service fronting the deployment, if one was created."""
+        return self._service
+
+    @property
+    def ingress(self) -> Optional[Ingress]:
+        """Get the Ingress routing to the Service, if one was created."""
+        return self._ingress
+
+    def import_targets(self, outputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Describe the namespace, deployment, service and ingress for adoption.
+
+        Args:
+            outputs: The component's section of the recorded stack outputs
+
+        Returns:
+            List of import targets
+        """
+        namespace: str = outputs.get("deployment_namespace", self.namespace_name)
+        targets: List[Dict[str, Any]] = super().import_targets(outputs)
+        targets.append({
+            "type": "kubernetes:apps/v1:Deployment",
+            "name": self.name,
+            "namespace": namespace,
+            "resource_name": outputs.get("name"),
+        })
+        # 输出缺失时按 app 标签和自动命名前缀查找，避免重复创建 Service/Ingress；
+        # 旧部署或 service=False 时集群中没有它们，因此为可选目标
+        targets.append({
+            "type": "kubernetes:core/v1:Service",
+            "name": self.name,
+            "namespace": namespace,
+            "resource_name": outputs.get("service_name"),
+            "labels": self.app_labels,
+            "optional": True,
+        })
+        targets.append({
+            "type": "kubernetes:networking.k8s.io/v1:Ingress",
+            "name": self.name,
+            "namespace": namespace,
+            "resource_name": outputs.get("ingress_name"),
+            "labels": self.app_labels,
+            "optional": True,
+        })
+        return targets
+
+    def deploy(
+        self,
+        depends_on_release: Optional[Union[pulumi.Resource, List[pulumi.Resource]]] = None,
+        **kwargs: Dict[str, Any]
+    ) -> Tuple[Deployment, Namespace]:
         """Deploy Nginx component.
 
         Args:
+            depends_on_release: Optional ingress controller release the Ingress depends on
             **kwargs: Additional deployment configuration
                 replicas: Number of replicas (default: 1)
                 image: Docker image to use (default: nginx:latest)
                 resources: Resource limits and requests
                 probes: Health check configuration
+                service: Create a Service for the deployment (default: False)
+                traffic_distribution: Service trafficDistribution
+                    (default: PreferClose, or None when topology_mode is set)
+                topology_mode: Value for the topology-mode annotation, e.g. Auto, for
+                    clusters older than 1.30 (default: None)
+                ingress: Create an Ingress for the Service, implies service (default: False)
+                hostname: Ingress host (default: nginx.local)
+                ingress_class: Ingress class name (default: nginx)
+                ingress_annotations: Additional Ingress annotations
 
         Returns:
             tuple: (deployment, namespace)
@@ -46,7 +111,7 @@ class NginxComponent(BaseComponent):
                         "containers": [{
                             "name": self.name,
                             "image": kwargs.get("image", "nginx:latest"),
-                            "ports": [{"container_port": 80}],
+                            "ports": [{"name": "http", "container_port": 80}],
                             "resources": kwargs.get("resources", {
                                 "requests": {"cpu": "100m", "memory": "128Mi"},
                                 "limits": {"cpu": "200m", "memory": "256Mi"},
@@ -68,4 +133,125 @@ class NginxComponent(BaseComponent):
             },
         )
         self._resource = deployment
+
+        if kwargs.get("service", False) or kwargs.get("ingress", False):
+            self._service = self.create_service(**kwargs)
+        if kwargs.get("ingress", False):
+            self._ingress = self.create_ingress(depends_on_release, **kwargs)
+
         return deployment, self.namespace
+
+    def create_service(self, **kwargs: Dict[str, Any]) -> Service:
+        """Create a ClusterIP Service with topology-aware routing.
+
+        Args:
+            **kwargs: Service configuration
+                traffic_distribution: Service trafficDistribution
+                    (default: PreferClose, or None when topology_mode is set)
+                topology_mode: Value for the topology-mode annotation, e.g. Auto, for
+                    clusters older than 1.30 (default: None)
+
+        Returns:
+            Created service resource
+        """
+        annotations: Dict[str, str] = {}
+        # 旧集群（< 1.30）不支持 trafficDistribution，可退回到 topology hints；
+        # 该注解在新集群上也优先于 trafficDistribution，因此两者默认不同时设置
+        topology_mode: Optional[str] = kwargs.get("topology_mode")
+        if topology_mode:
+            annotations["service.kubernetes.io/topology-mode"] = topology_mode
+
+        spec: Dict[str, Any] = {
+            "type": "ClusterIP",
+            "selector": self.app_labels,
+            "ports": [{
+                "name": "http",
+                "port": 80,
+                "target_port": "http",
+                "protocol": "TCP",
+            }],
+        }
+        # 优先将流量路由到同一可用区的 endpoints
+        traffic_distribution: Optional[str] = kwargs.get(
+            "traffic_distribution",
+            None if topology_mode else "PreferClose"
+        )
+        if traffic_distribution:
+            spec["traffic_distribution"] = traffic_distribution
+
+        return Service(
+            self.name,
+            metadata={
+                "namespace": self.namespace.metadata["name"],
+                "labels": self.app_labels,
+                "annotations": annotations,
+            },
+            spec=spec,
+        )
+
+    def create_ingress(
+        self,
+        depends_on_release: Optional[Union[pulumi.Resource, List[pulumi.Resource]]] = None,
+        **kwargs: Dict[str, Any]
+    ) -> Ingress:
+        """Create an Ingress bound to the ingress-nginx controller class.
+
+        Args:
+            depends_on_release: Optional ingress controller release dependency
+            **kwargs: Ingress configuration
+                hostname: Ingress host (default: nginx.local)
+                ingress_class: Ingress class name (default: nginx)
+                ingress_annotations: Additional Ingress annotations
+
+        Returns:
+            Created ingress resource
+        """
+        if self._service is None:
+            raise ValueError("A Service must be created before the Ingress")
+
+        annotations: Dict[str, str] = {
+            # 通过 Service ClusterIP 转发，使 trafficDistribution 在请求路径上生效；
+            # keepalive 连接会经 conntrack 固定到单个 Pod，多副本时负载可能不均
+            "nginx.ingress.kubernetes.io/service-upstream": "true",
+            # 静态内容响应较小，开启缓冲以尽快释放 upstream 连接
+            "nginx.ingress.kubernetes.io/proxy-buffering": "on",
+            "nginx.ingress.kubernetes.io/proxy-buffer-size": "8k",
+            "nginx.ingress.kubernetes.io/proxy-buffers-number": "8",
+            **(kwargs.get("ingress_annotations", {}))
+        }
+
+        # 处理依赖关系
+        resource_opts = pulumi.ResourceOptions()
+        if depends_on_release is not None:
+            if isinstance(depends_on_release, list):
+                resource_opts.depends_on = depends_on_release
+            else:
+                resource_opts.depends_on = [depends_on_release]
+
+        return Ingress(
+            self.name,
+            metadata={
+                "namespace": self.namespace.metadata["name"],
+                "labels": self.app_labels,
+                "annotations": annotations,
+            },
+            spec={
+                "ingress_class_name": kwargs.get("ingress_class", "nginx"),
+                "rules": [{
+                    "host": kwargs.get("hostname", "nginx.local"),
+                    "http": {
+                        "paths": [{
+                            "path": "/",
+                            "path_type": "Prefix",
+                            "backend": {
+                                "service": {
+                                    "name": self._service.metadata["name"],
+                                    "port": {"name": "http"},
+                                },
+                            },
+                        }],
+                    },
+                }],
+            },
+            opts=resource_opts,
+        )
@@ -7,9 +7,9 @@ from typing import Dict, Optional, Tuple, Any, Union, List
 import pulumi
 import pulumi_kubernetes.helm.v3 as helm
 from pulumi_kubernetes.core.v1 import Namespace
-from .base_component import BaseComponent
+from .helm_component import HelmComponent
 
-class RancherComponent(BaseComponent):
+class RancherComponent(HelmComponent):
     """Rancher deployment component."""
 
     def __init__(self, name: str = "rancher", namespace: str = "cattle-system") -> None:
@@ -0,0 +1,26 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Component instances shared by the Pulumi program and recovery."""
+
+from typing import Dict
+from .base_component import BaseComponent
+from .nginx import NginxComponent
+from .cert_manager import CertManagerComponent
+from .rancher import RancherComponent
+from .ingress import IngressComponent
+
+nginx_component: NginxComponent = NginxComponent(name="nginx")
+cert_manager_component: CertManagerComponent = CertManagerComponent(name="cert-manager")
+ingress_component: IngressComponent = IngressComponent(name="ingress-nginx")
+rancher_component: RancherComponent = RancherComponent(name="rancher", namespace="cattle-system")
+
+# 键为 stack outputs（state/outputs.json）中对应的段名
+COMPONENTS: Dict[str, BaseComponent] = {
+    "nginx": nginx_component,
+    "cert_manager": cert_manager_component,
+    "ingress": ingress_component,
+    "rancher": rancher_component,
+}
@@ -0,0 +1,202 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Generate a Pulumi bulk import file from resources already in the cluster.
+
+Used when the local state backend is lost: instead of reinstalling every
+chart, the running Helm releases, namespaces and workloads are discovered by
+label and by the suffixed names recorded in state/outputs.json, and adopted
+with a single `pulumi import --file`.
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from components.registry import COMPONENTS
+
+RELEASE_TYPE: str = "kubernetes:helm.sh/v3:Release"
+
+# Pulumi 类型 -> 列表 API 路径
+KINDS: Dict[str, str] = {
+    "kubernetes:core/v1:Namespace": "/api/v1/namespaces",
+    "kubernetes:apps/v1:Deployment": "/apis/apps/v1/namespaces/{namespace}/deployments",
+    "kubernetes:core/v1:Service": "/api/v1/namespaces/{namespace}/services",
+    "kubernetes:networking.k8s.io/v1:Ingress": "/apis/networking.k8s.io/v1/namespaces/{namespace}/ingresses",
+    # Helm 3 将 release 存储在带 owner=helm 标签的 Secret 中
+    RELEASE_TYPE: "/api/v1/namespaces/{namespace}/secrets",
+}
+
+
+class KubeClient:
+    """Minimal read-only Kubernetes API client."""
+
+    def __init__(self, server: Optional[str] = None, fixtures: Optional[str] = None) -> None:
+        """Initialize the client.
+
+        Args:
+            server: API server URL, e.g. from `kubectl proxy` or a fake API server.
+                If neither server nor fixtures is given, `kubectl get --raw` is used.
+            fixtures: Directory of recorded list responses
+        """
+        self.server: Optional[str] = server.rstrip("/") if server else None
+        self.fixtures: Optional[Path] = Path(fixtures) if fixtures else None
+
+    def list(self, path: str, labels: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """List objects under an API collection path.
+
+        Args:
+            path: Collection path, e.g. /api/v1/namespaces
+            labels: Optional label selector
+
+        Returns:
+            Objects matching the label selector
+        """
+        query: str = ""
+        if labels:
+            selector: str = ",".join(f"{key}={value}" for key, value in labels.items())
+            query = "?" + urllib.parse.urlencode({"labelSelector": selector})
+
+        if self.fixtures is not None:
+            fixture: Path = self.fixtures / (path.strip("/").replace("/", "_") + ".json")
+            body: Dict[str, Any] = json.loads(fixture.read_text()) if fixture.exists() else {}
+        elif self.server is not None:
+            try:
+                with urllib.request.urlopen(self.server + path + query, timeout=30) as response:
+                    body = json.load(response)
+            except urllib.error.HTTPError as error:
+                if error.code != 404:
+                    raise
+                body = {}
+        else:
+            result = subprocess.run(
+                ["kubectl", "get", "--raw", path + query],
+                capture_output=True, text=True, check=True, timeout=30
+            )
+            body = json.loads(result.stdout)
+
+        # 录制的 fixture 不会按标签过滤，这里统一在本地再过滤一次
+        return [
+            item for item in body.get("items", [])
+            if all(
+                item["metadata"].get("labels", {}).get(key) == value
+                for key, value in (labels or {}).items()
+            )
+        ]
+
+
+def resolve(client: KubeClient, target: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """Find the live resource for an import target.
+
+    Args:
+        client: Kubernetes API client
+        target: Import target returned by a component
+
+    Returns:
+        Pulumi import spec, or None if nothing matches in the cluster
+
+    Raises:
+        LookupError: If more than one live resource matches
+    """
+    namespace: Optional[str] = target.get("namespace")
+    items: List[Dict[str, Any]] = client.list(
+        KINDS[target["type"]].format(namespace=namespace),
+        target.get("labels")
+    )
+
+    # 优先匹配 outputs.json 中记录的名称，否则按 Pulumi 自动命名（名称-8位十六进制）匹配，
+    # 以免误匹配 rancher-webhook 这类同前缀的 release
+    resource_name: Optional[str] = target.get("resource_name")
+    # Helm release 的名称记录在存储 Secret 的 name 标签上
+    if target["type"] == RELEASE_TYPE:
+        names = {item["metadata"].get("labels", {}).get("name", "") for item in items}
+    else:
+        names = {item["metadata"]["name"] for item in items}
+    if resource_name:
+        matches = [name for name in names if name == resource_name]
+    else:
+        autoname = re.compile(rf"{re.escape(target['name'])}-[0-9a-f]{{8}}")
+        matches = [name for name in names if autoname.fullmatch(name)]
+
+    if len(matches) > 1:
+        raise LookupError(f"ambiguous match: {', '.join(sorted(matches))}")
+    if not matches:
+        return None
+    return {
+        "type": target["type"],
+        "name": target["name"],
+        "id": f"{namespace}/{matches[0]}" if namespace else matches[0],
+    }
+
+
+def main() -> int:
+    """Write the import file for all components found in the cluster."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--outputs", default="state/outputs.json", help="Recorded stack outputs")
+    parser.add_argument("--output", default="state/recover/import.json", help="Import file to write")
+    parser.add_argument("--server", help="Kubernetes API URL, e.g. http://127.0.0.1:8001")
+    parser.add_argument(
+        "--fixtures",
+        help="Directory of recorded API list responses, for tests and debugging only"
+    )
+    args = parser.parse_args()
+
+    outputs_path = Path(args.outputs)
+    outputs: Dict[str, Any] = json.loads(outputs_path.read_text()) if outputs_path.exists() else {}
+    client = KubeClient(server=args.server, fixtures=args.fixtures)
+
+    targets: List[Dict[str, Any]] = [
+        target
+        for key, component in COMPONENTS.items()
+        for target in component.import_targets(outputs.get(key, {}))
+    ]
+
+    def lookup(target: Dict[str, Any]) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+        try:
+            spec = resolve(client, target)
+        except subprocess.CalledProcessError as error:
+            return None, (error.stderr or str(error)).strip()
+        except (subprocess.SubprocessError, OSError, ValueError, LookupError) as error:
+            # OSError 涵盖 URLError 及 kubectl 不存在，ValueError 涵盖无效的 JSON
+            return None, str(error)
+        if spec is None and not target.get("optional", False):
+            return None, "not found"
+        return spec, None
+
+    # 所有查询互不依赖，并行读取 API
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        results: List[Tuple[Optional[Dict[str, str]], Optional[str]]] = list(
+            executor.map(lookup, targets)
+        )
+
+    failed: int = 0
+    for target, (spec, error) in zip(targets, results):
+        if error is not None:
+            failed += 1
+            print(f"Failed: {target['type']} {target['name']}: {error}", file=sys.stderr)
+        elif spec is None:
+            print(
+                f"Skipped: {target['type']} {target['name']}: not found, "
+                "the next up will create it",
+                file=sys.stderr
+            )
+
+    resources: List[Dict[str, str]] = [spec for spec, _ in results if spec is not None]
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps({"resources": resources}, indent=2) + "\n")
+    print(f"Wrote {len(resources)} import specs to {args.output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
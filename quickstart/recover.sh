@@ -0,0 +1,58 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+# Rebuild the stack checkpoint from resources already running in the cluster.
+# Usage: ./recover.sh [--server http://127.0.0.1:8001]
+
+mkdir -p $(pwd)/state
+
+export PULUMI_BACKEND_URL=file://$(pwd)/state
+export PULUMI_CONFIG_PASSPHRASE="123456"
+pulumi login $PULUMI_BACKEND_URL
+
+# 先只读地查询集群，失败时不改动现有状态
+uv run python recover.py --outputs $(pwd)/state/outputs.json --output $(pwd)/state/recover/import.json "$@"
+if [ $? -ne 0 ]; then
+    echo "Some resources were not found or could not be read. Check the errors above before importing."
+    exit 1
+fi
+
+# 现有 stack 文件可能已损坏或只含部分资源，备份后重置，再导入到空 stack
+STACK_DIR=$(pwd)/state/.pulumi/stacks/quickstart
+if ls $STACK_DIR/dev.json* > /dev/null 2>&1; then
+    BACKUP_DIR=$(pwd)/state/recover/backup-$(date +%Y%m%d%H%M%S)
+    mkdir -p $BACKUP_DIR
+    cp $STACK_DIR/dev.json* $BACKUP_DIR/
+    echo "Existing stack state backed up to $BACKUP_DIR"
+
+    pulumi stack rm dev --force --preserve-config --yes
+    if [ $? -ne 0 ]; then
+        # 文件损坏时 pulumi 可能无法加载该 stack，直接删除（已备份）
+        rm -f $STACK_DIR/dev.json*
+    fi
+fi
+
+pulumi stack init dev
+if [ $? -ne 0 ]; then
+    echo "Failed to create an empty dev stack."
+    exit 1
+fi
+
+pulumi import --yes --stack dev --file $(pwd)/state/recover/import.json --protect=false --generate-code=false
+if [ $? -ne 0 ]; then
+    echo "Pulumi import failed. Please check the output for errors."
+    exit 1
+fi
+echo "Checkpoint rebuilt from $(pwd)/state/recover/import.json"
+
+# Helm release 的 repository_opts、timeout、create_namespace 无法从集群读回，
+# 因此首次 up 会对 cert-manager、ingress-nginx 和 Rancher 执行原地 helm upgrade，而非重装
+pulumi preview --stack dev --diff
+if [ $? -ne 0 ]; then
+    echo "Pulumi preview failed. Please check the output for errors."
+    exit 1
+fi
+echo "Recovery completed. Review the preview above: the Helm releases are expected to show in-place updates, not replacements."
+echo "Run 'pulumi up --yes --stack dev' to apply them."
@@ -0,0 +1,10 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import sys
+from pathlib import Path
+
+# 使测试可以直接导入 components 包
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,140 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Tests for the Service and Ingress generated by NginxComponent."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pulumi
+import pytest
+from pulumi_kubernetes.core.v1 import Namespace
+from pulumi_kubernetes.networking.v1 import Ingress
+
+import components.nginx as nginx_module
+from components.nginx import NginxComponent
+
+
+class Mocks(pulumi.runtime.Mocks):
+    """Echo resource inputs back as outputs, autonaming metadata.name."""
+
+    def new_resource(self, args: pulumi.runtime.MockResourceArgs) -> Tuple[str, Dict[str, Any]]:
+        outputs: Dict[str, Any] = dict(args.inputs)
+        metadata: Dict[str, Any] = dict(outputs.get("metadata", {}))
+        metadata.setdefault("name", f"{args.name}-0123abcd")
+        outputs["metadata"] = metadata
+        return f"{args.name}_id", outputs
+
+    def call(self, args: pulumi.runtime.MockCallArgs) -> Dict[str, Any]:
+        return {}
+
+
+pulumi.runtime.set_mocks(Mocks(), preview=False)
+
+
+@pytest.fixture
+def recorded_ingress_opts(monkeypatch: pytest.MonkeyPatch) -> List[Optional[pulumi.ResourceOptions]]:
+    """Record the ResourceOptions passed to every Ingress the component creates."""
+    recorded: List[Optional[pulumi.ResourceOptions]] = []
+
+    class RecordingIngress(Ingress):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            recorded.append(kwargs.get("opts"))
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(nginx_module, "Ingress", RecordingIngress)
+    return recorded
+
+
+@pulumi.runtime.test
+def test_ingress_implies_service() -> pulumi.Output:
+    component = NginxComponent(name="implied")
+    component.deploy(ingress=True)
+    assert component.service is not None
+    assert component.ingress is not None
+
+    def check(args: List[Any]) -> None:
+        spec, backend = args
+        assert spec["traffic_distribution"] == "PreferClose"
+        assert spec["selector"] == {"app": "implied"}
+        assert backend["service"]["name"] == "implied-0123abcd"
+        assert backend["service"]["port"] == {"name": "http"}
+
+    return pulumi.Output.all(
+        component.service.spec,
+        component.ingress.spec.rules[0].http.paths[0].backend,
+    ).apply(check)
+
+
+@pulumi.runtime.test
+def test_service_only() -> pulumi.Output:
+    component = NginxComponent(name="service-only")
+    component.deploy(service=True)
+    assert component.service is not None
+    assert component.ingress is None
+
+    def check(spec: Dict[str, Any]) -> None:
+        assert spec["traffic_distribution"] == "PreferClose"
+        assert spec["ports"][0]["target_port"] == "http"
+
+    return component.service.spec.apply(check)
+
+
+@pulumi.runtime.test
+def test_topology_mode_clears_traffic_distribution() -> pulumi.Output:
+    component = NginxComponent(name="topology")
+    component.deploy(service=True, topology_mode="Auto")
+
+    def check(args: List[Any]) -> None:
+        metadata, spec = args
+        assert metadata["annotations"] == {"service.kubernetes.io/topology-mode": "Auto"}
+        assert "traffic_distribution" not in spec
+
+    return pulumi.Output.all(component.service.metadata, component.service.spec).apply(check)
+
+
+@pulumi.runtime.test
+def test_ingress_class_and_annotations() -> pulumi.Output:
+    component = NginxComponent(name="annotated")
+    component.deploy(
+        ingress=True,
+        hostname="annotated.local",
+        ingress_class="edge",
+        ingress_annotations={
+            "nginx.ingress.kubernetes.io/service-upstream": "false",
+            "nginx.ingress.kubernetes.io/proxy-body-size": "10m",
+        },
+    )
+
+    def check(args: List[Any]) -> None:
+        metadata, spec = args
+        annotations: Dict[str, str] = metadata["annotations"]
+        assert annotations["nginx.ingress.kubernetes.io/service-upstream"] == "false"
+        assert annotations["nginx.ingress.kubernetes.io/proxy-body-size"] == "10m"
+        assert annotations["nginx.ingress.kubernetes.io/proxy-buffering"] == "on"
+        assert "nginx.ingress.kubernetes.io/proxy-http-version" not in annotations
+        assert spec["ingress_class_name"] == "edge"
+        assert spec["rules"][0]["host"] == "annotated.local"
+
+    return pulumi.Output.all(component.ingress.metadata, component.ingress.spec).apply(check)
+
+
+@pulumi.runtime.test
+def test_ingress_depends_on_release(
+    recorded_ingress_opts: List[Optional[pulumi.ResourceOptions]]
+) -> None:
+    controller = Namespace("controller")
+    component = NginxComponent(name="dependent")
+    component.deploy(depends_on_release=controller, ingress=True)
+
+    assert len(recorded_ingress_opts) == 1
+    assert recorded_ingress_opts[0].depends_on == [controller]
+
+
+@pulumi.runtime.test
+def test_no_service_by_default() -> None:
+    component = NginxComponent(name="plain")
+    component.deploy()
+    assert component.service is None
+    assert component.ingress is None
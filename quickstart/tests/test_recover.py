@@ -0,0 +1,175 @@
+# Copyright (c) 2025 Kk
+#
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+"""Tests for recover.py against recorded API responses and a fake API server."""
+
+import json
+import shutil
+import subprocess
+import sys
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+import pytest
+
+PROJECT_DIR: Path = Path(__file__).resolve().parent.parent
+FIXTURES_DIR: Path = Path(__file__).resolve().parent / "fixtures"
+# 录制时 stack outputs 与 checkpoint 中 Kubernetes 资源的快照；state/ 下的文件会随每次部署变化
+OUTPUTS: Path = FIXTURES_DIR / "outputs.json"
+EXPECTED_IMPORT: Path = FIXTURES_DIR / "expected_import.json"
+
+
+def checkpoint_specs() -> Set[Tuple[str, str, str]]:
+    """Collect (type, logical name, id) of the resources in the recorded checkpoint."""
+    return as_set(json.loads(EXPECTED_IMPORT.read_text())["resources"])
+
+
+def run_recover(tmp_path: Path, *args: str) -> Tuple[subprocess.CompletedProcess, List[Dict[str, str]]]:
+    """Run recover.py and return the process result and written import specs."""
+    output: Path = tmp_path / "import.json"
+    result = subprocess.run(
+        [sys.executable, "recover.py", "--output", str(output), *args],
+        cwd=PROJECT_DIR, capture_output=True, text=True, timeout=60
+    )
+    resources: List[Dict[str, str]] = json.loads(output.read_text())["resources"] if output.exists() else []
+    return result, resources
+
+
+def as_set(resources: List[Dict[str, str]]) -> Set[Tuple[str, str, str]]:
+    """Convert import specs to comparable tuples."""
+    return {(spec["type"], spec["name"], spec["id"]) for spec in resources}
+
+
+def copy_fixtures(tmp_path: Path) -> Path:
+    """Copy the recorded fixtures so a test can add or remove responses."""
+    fixtures: Path = tmp_path / "fixtures"
+    shutil.copytree(FIXTURES_DIR, fixtures)
+    return fixtures
+
+
+def write_list(fixtures: Path, name: str, kind: str, api_version: str, *names: str) -> None:
+    """Write a list response of objects labelled app=nginx in the nginx namespace."""
+    items: List[Dict[str, Any]] = [
+        {"metadata": {"name": item, "namespace": "nginx", "labels": {"app": "nginx"}}}
+        for item in names
+    ]
+    (fixtures / f"{name}.json").write_text(json.dumps({
+        "kind": kind, "apiVersion": api_version, "items": items
+    }))
+
+
+@pytest.fixture
+def fake_api_server() -> Iterator[str]:
+    """Serve the recorded fixtures as a minimal Kubernetes API server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            path: str = urllib.parse.urlparse(self.path).path
+            fixture: Path = FIXTURES_DIR / (path.strip("/").replace("/", "_") + ".json")
+            if not fixture.exists():
+                self.send_response(404)
+                self.end_headers()
+                return
+            body: bytes = fixture.read_bytes()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fixtures_match_checkpoint(tmp_path: Path) -> None:
+    # 录制的集群部署于 Service/Ingress 引入之前，二者应被跳过而不是导致失败
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(OUTPUTS), "--fixtures", str(FIXTURES_DIR)
+    )
+    assert result.returncode == 0, result.stderr
+    assert as_set(resources) == checkpoint_specs()
+    assert len(resources) == len(as_set(resources))
+    assert "Skipped: kubernetes:core/v1:Service nginx" in result.stderr
+    assert "Skipped: kubernetes:networking.k8s.io/v1:Ingress nginx" in result.stderr
+
+
+def test_fallback_without_outputs(tmp_path: Path) -> None:
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(tmp_path / "missing.json"), "--fixtures", str(FIXTURES_DIR)
+    )
+    assert result.returncode == 0, result.stderr
+    assert as_set(resources) == checkpoint_specs()
+
+
+def test_fake_api_server_matches_checkpoint(tmp_path: Path, fake_api_server: str) -> None:
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(OUTPUTS), "--server", fake_api_server
+    )
+    assert result.returncode == 0, result.stderr
+    assert as_set(resources) == checkpoint_specs()
+
+
+def test_optional_service_and_ingress_adopted(tmp_path: Path) -> None:
+    fixtures: Path = copy_fixtures(tmp_path)
+    write_list(fixtures, "api_v1_namespaces_nginx_services", "ServiceList", "v1", "nginx-5d2c7f3a")
+    write_list(
+        fixtures, "apis_networking.k8s.io_v1_namespaces_nginx_ingresses",
+        "IngressList", "networking.k8s.io/v1", "nginx-9b41e6c0"
+    )
+
+    # outputs.json 中未记录 Service/Ingress 名称，按标签和自动命名查找
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(OUTPUTS), "--fixtures", str(fixtures)
+    )
+    assert result.returncode == 0, result.stderr
+    assert as_set(resources) == checkpoint_specs() | {
+        ("kubernetes:core/v1:Service", "nginx", "nginx/nginx-5d2c7f3a"),
+        ("kubernetes:networking.k8s.io/v1:Ingress", "nginx", "nginx/nginx-9b41e6c0"),
+    }
+
+
+def test_ambiguous_match_fails(tmp_path: Path) -> None:
+    fixtures: Path = copy_fixtures(tmp_path)
+    write_list(
+        fixtures, "api_v1_namespaces_nginx_services", "ServiceList", "v1",
+        "nginx-5d2c7f3a", "nginx-71e0b2d4"
+    )
+
+    result, _ = run_recover(tmp_path, "--outputs", str(OUTPUTS), "--fixtures", str(fixtures))
+    assert result.returncode == 1
+    assert "kubernetes:core/v1:Service nginx: ambiguous match" in result.stderr
+
+
+def test_missing_required_resource_fails(tmp_path: Path) -> None:
+    fixtures: Path = copy_fixtures(tmp_path)
+    (fixtures / "apis_apps_v1_namespaces_nginx_deployments.json").unlink()
+
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(OUTPUTS), "--fixtures", str(fixtures)
+    )
+    assert result.returncode == 1
+    assert "Failed: kubernetes:apps/v1:Deployment nginx: not found" in result.stderr
+    assert as_set(resources) == checkpoint_specs() - {
+        ("kubernetes:apps/v1:Deployment", "nginx", "nginx/nginx-db85cd1a"),
+    }
+
+
+def test_unreachable_server_fails(tmp_path: Path) -> None:
+    result, resources = run_recover(
+        tmp_path, "--outputs", str(OUTPUTS), "--server", "http://127.0.0.1:1"
+    )
+    assert result.returncode == 1
+    assert "Failed: kubernetes:core/v1:Namespace nginx:" in result.stderr
+    assert resources == []